@@ -4,188 +4,339 @@ Larry David Bot - A Bluesky bot that posts fictional Larry David quotes
 Posts every hour with modern-day observations and complaints
 """
 
+import functools
 import os
 import json
+import re
+import textwrap
+import threading
 import time
 import schedule
 import logging
+import logging.handlers
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List, Optional
-import random
-
-import google.generativeai as genai
-import tweepy
-from atproto import Client
-try:
-    from atproto import RichText
-except ImportError:  # Older atproto version without RichText helper
-    RichText = None
+
 from dotenv import load_dotenv
 
+def _genai():
+    """Import google.generativeai on first use; it drags in a large grpc/protobuf tree."""
+    import google.generativeai as genai
+    return genai
+
 # Load environment variables
 load_dotenv()
 
-# Configure logging
+# Configure logging; rotate the log file so it doesn't grow without bound
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('larry_david_bot.log'),
+        logging.handlers.RotatingFileHandler(
+            'larry_david_bot.log', maxBytes=1_000_000, backupCount=3),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Built once at import time; dedented so we don't send leading-indent
+# whitespace as prompt tokens on every Gemini call
+_LARRY_PROMPT = textwrap.dedent("""\
+    You are Larry David from Curb Your Enthusiasm. You're known for your
+    neurotic, socially awkward personality and your tendency to get into awkward situations.
+    You're often frustrated by social norms and petty annoyances. You're direct, blunt,
+    and have a unique perspective on everyday life.
+
+    Generate a short, funny quote as if you're Larry David. Make it sound
+    exactly like something Larry David would say. It should be observational, slightly
+    complaining, and highlight the absurdity of modern life.
+
+    - Be under 281 characters (Twitter/X-friendly)
+    - Reflect Larry's neurotic, petty, or brutally honest personality
+    - Be observational, cranky, or socially awkward—like a mini-rant or ethical debate
+    - Feel like something he'd say mid-confrontation or in a passive-aggressive monologue
+    - Do NOT start a quote with "You know" or "You ever"
+    - Do NOT end the quote with "you know.." or similar repetitive phrases
+    - Be self-contained and funny
+    - Do not include quotation marks before or after the quote
+
+    Examples:
+
+    - "I don't trust anyone who's nice to me but rude to the waiter. Because they're just
+    waiting until they can be rude to me too."
+
+    - "I don't like to make plans for the day because then the word 'premeditated' gets
+    thrown around in the courtroom."
+
+    - "I held the door for someone who was too far away. Now I'm standing here like a doorman. I didn't sign up for this."
+
+    - "I don't understand why people take selfies with celebrities. What are you going to
+    do with that? 'Here's me bothering a famous person'?"
+
+    - "I said "bless you" once. You sneezed four more times. How many blessings do you need? It's not a sneeze-a-thon."
+
+    - "I asked if I could sample a grape. Suddenly I'm the shoplifter of the produce aisle."
+
+    - "I brought my own fork to the barbecue. Now I'm the weirdo? They had sporks, Jeff. Sporks!"
+
+    - "You can't call it "casual Friday" and then judge me for wearing Crocs. That's the deal. That's the contract."
+
+    - "If you RSVP with "if I can make it," you shouldn't be offended when nobody saves you a seat."
+
+    - "Why do people say "you'll love this show" like it's a threat? Now I have to love it or I'm the problem."
+
+    - "The minute you say "take your time," you've started a countdown. That's fake generosity.
+
+    Recent quotes (AVOID repeating these specific topics or exact phrasings):
+    {recent_quotes_text}
+    """).strip()
+
+# Appended to the prompt so one Gemini round trip yields several candidates;
+# post_quote drains the buffer before paying for another API call
+_BATCH_INSTRUCTION = "\n\nReturn a JSON array of 5 distinct quotes, no prose."
+
+_FALLBACK_QUOTES = (
+    "You know what I hate? When you're at a restaurant and the server says 'Enjoy your meal' and you say 'You too'.",
+    "I don't trust anyone who's nice to me but rude to the waiter. Because they're just waiting until they can be rude to me too.",
+    "I don't like to make plans for the day because then the word 'premeditated' gets thrown around in the courtroom.",
+    "You know what's interesting about politics? It's not interesting.",
+    "I'm not a fighter, but I am a big fan of the silent treatment.",
+)
+
+_URL_HINTS = ('http://', 'https://', 'www.', '.com', '.net', '.org')
+
+@functools.lru_cache(maxsize=128)
+def _has_url(text: str) -> bool:
+    """Cheap pre-check for link-like substrings before paying for RichText."""
+    return any(hint in text for hint in _URL_HINTS)
+
+def _norm_quote(quote: str) -> str:
+    """Canonical form for duplicate detection: lowercase, punctuation collapsed."""
+    return re.sub(r'\W+', ' ', quote.lower()).strip()
+
+# Leading/trailing whitespace and quotation marks, straight or smart
+_STRIP_RE = re.compile(r'^[\s"\'“”‘’]+|[\s"\'“”‘’]+$')
+
+def _clean_quote(quote: str) -> str:
+    """Strip whitespace and wrapping quotation marks from a generated quote."""
+    return _STRIP_RE.sub('', quote)
+
+def _parse_quote_batch(text: str) -> List[str]:
+    """Parse a JSON array of candidate quotes; return [] if it isn't one."""
+    # Gemini often wraps JSON answers in a markdown code fence
+    if text.startswith('```'):
+        text = text.strip('`')
+        if text.startswith('json'):
+            text = text[4:]
+    try:
+        candidates = json.loads(text)
+    except ValueError:
+        return []
+    if not isinstance(candidates, list):
+        return []
+    return [_clean_quote(q) for q in candidates if isinstance(q, str) and q.strip()]
+
+def generate_quotes(model, recent_quotes=(), temperature=None) -> List[str]:
+    """Run one Gemini generation against the Larry prompt and return the candidates.
+
+    Shared by the bot and test_bot.py so the prompt and response handling
+    live in exactly one place. A temperature may be passed to push the model
+    toward more diverse output when it keeps repeating itself.
+    """
+    recent_quotes_text = "\n    - ".join(f'"{q}"' for q in recent_quotes)
+    prompt = _LARRY_PROMPT.format(recent_quotes_text=recent_quotes_text) + _BATCH_INSTRUCTION
+    generation_config = None
+    if temperature is not None:
+        generation_config = _genai().types.GenerationConfig(temperature=temperature)
+    response = model.generate_content(prompt, generation_config=generation_config)
+    text = response.text.strip()
+    # The model may ignore the JSON instruction; treat the response as one quote
+    return _parse_quote_batch(text) or [_clean_quote(text)]
+
+_TWITTER_ERROR_MESSAGES = {
+    403: "Twitter API Error: Authentication or permission error. "
+         "Please check your API keys and app permissions.",
+    401: "Twitter API Error: Invalid or expired credentials. "
+         "Please check your Twitter API keys and access tokens.",
+    429: "Twitter API Error: Rate limit exceeded. The bot will try again later.",
+}
+
 class LarryDavidBot:
     def __init__(self):
         """Initialize the Larry David Bot with Bluesky client and configuration."""
+        # Heavy SDKs are imported here rather than at module top so that
+        # importing this module (e.g. from test_bot.py) stays cheap
+        from atproto import Client
+        try:
+            from atproto import RichText
+        except ImportError:  # Older atproto version without RichText helper
+            RichText = None
+        self._RichText = RichText
+
         self.client = Client()
-        self.posts_cache_file = 'recent_posts.json'
+        self.posts_cache_file = 'recent_posts.jsonl'
+        self._legacy_cache_file = 'recent_posts.json'
         self.max_cache_size = 100  # Keep last 100 posts to avoid repeats
-        self.recent_posts = self.load_recent_posts()
-        
-        # Bluesky credentials
-        self.handle = os.getenv('BLUESKY_HANDLE')
-        self.app_password = os.getenv('BLUESKY_APP_PASSWORD')
-        
-        # Gemini configuration
-        self.gemini_api_key = os.getenv('GEMINI_API_KEY')
-        
-        if not all([self.handle, self.app_password, self.gemini_api_key]):
-            raise ValueError("Missing required environment variables. Check BLUESKY_HANDLE, BLUESKY_APP_PASSWORD, and GEMINI_API_KEY")
+        self.recent_posts = deque(self.load_recent_posts(), maxlen=self.max_cache_size)
+        self._norm_set = {_norm_quote(q) for q in self.recent_posts}
+        self._stop = threading.Event()  # Set to wake and stop the scheduler loop
+        # One worker per network target; guards below protect the shared cache
+        self._exec = ThreadPoolExecutor(max_workers=2)
+        self._cache_lock = threading.Lock()
+        # Compact when the append-only log has grown far past the cache bound,
+        # or materialize it on the first run after migrating from the old format
+        if self.recent_posts and (self._cache_lines == 0
+                                  or self._cache_lines > 10 * self.max_cache_size):
+            self.compact_posts_file()
+        self._quote_buffer = deque()  # Unused candidates from the last Gemini batch
 
-        genai.configure(api_key=self.gemini_api_key)
+        # Shared HTTP session with connection pooling and backoff, so retry
+        # storms reuse pooled TLS connections instead of re-handshaking.
+        # (The atproto client manages its own transport and can't share it.)
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        ))
         
+        # Required credentials, checked in one pass so the error names every
+        # missing variable instead of one generic message
+        env = os.environ
+        required = ('BLUESKY_HANDLE', 'BLUESKY_APP_PASSWORD', 'GEMINI_API_KEY')
+        missing = [k for k in required if not env.get(k)]
+        if missing:
+            raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+        self.handle, self.app_password, self.gemini_api_key = (env[k] for k in required)
+
+        self._genai = _genai()
+        self._genai.configure(api_key=self.gemini_api_key)
+        # Build the model handle once; it holds session/auth state that is
+        # expensive to reconstruct on every generation call
+        self._model = self._genai.GenerativeModel('gemini-flash-latest')
+
         # Login to Bluesky
         self.client.login(self.handle, self.app_password)
-        logger.info(f"Logged in to Bluesky as {self.handle}")
+        logger.info("Logged in to Bluesky as %s", self.handle)
         
         # Twitter API v2 Client
         self.twitter_client = None
-        twitter_bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
-        
+        twitter_bearer_token = env.get('TWITTER_BEARER_TOKEN')
+
         if twitter_bearer_token:
             try:
+                # Only pull tweepy in when Twitter is actually configured
+                import tweepy
+                self._tweepy = tweepy
                 self.twitter_client = tweepy.Client(
                     bearer_token=twitter_bearer_token,
-                    consumer_key=os.getenv('TWITTER_API_KEY'),
-                    consumer_secret=os.getenv('TWITTER_API_SECRET'),
-                    access_token=os.getenv('TWITTER_ACCESS_TOKEN'),
-                    access_token_secret=os.getenv('TWITTER_ACCESS_SECRET')
+                    consumer_key=env.get('TWITTER_API_KEY'),
+                    consumer_secret=env.get('TWITTER_API_SECRET'),
+                    access_token=env.get('TWITTER_ACCESS_TOKEN'),
+                    access_token_secret=env.get('TWITTER_ACCESS_SECRET')
                 )
+                # Route tweepy through the shared pooled session
+                self.twitter_client.session = self._session
                 logger.info("Initialized Twitter API v2 client")
             except Exception as e:
-                logger.error(f"Error initializing Twitter client: {e}")
+                logger.error("Error initializing Twitter client: %s", e)
                 self.twitter_client = None
         else:
             logger.warning("Twitter Bearer Token not found. Twitter posting disabled.")
     
     def load_recent_posts(self) -> List[str]:
-        """Load recent posts from cache file to avoid duplicates."""
+        """Load recent posts from the JSONL cache file to avoid duplicates."""
+        self._cache_lines = 0
         try:
             if os.path.exists(self.posts_cache_file):
                 with open(self.posts_cache_file, 'r') as f:
+                    posts = [json.loads(line) for line in f if line.strip()]
+                self._cache_lines = len(posts)
+                return posts[-self.max_cache_size:]
+            if os.path.exists(self._legacy_cache_file):
+                # One-time migration from the old JSON-array cache
+                with open(self._legacy_cache_file, 'r') as f:
                     return json.load(f)
         except Exception as e:
-            logger.warning(f"Could not load recent posts cache: {e}")
+            logger.warning("Could not load recent posts cache: %s", e)
         return []
-    
-    def save_recent_posts(self):
-        """Save recent posts to cache file."""
+
+    def append_post(self, text: str):
+        """Append one post to the JSONL cache: O(1) bytes vs rewriting the file."""
         try:
-            with open(self.posts_cache_file, 'w') as f:
-                json.dump(self.recent_posts, f)
+            with open(self.posts_cache_file, 'a') as f:
+                f.write(json.dumps(text) + '\n')
+            self._cache_lines += 1
         except Exception as e:
-            logger.error(f"Could not save recent posts cache: {e}")
-    
-    def generate_larry_quote(self) -> str:
-        """Generate a new Larry David quote using OpenAI."""
-        prompt = """You are Larry David from Curb Your Enthusiasm. You're known for your 
-    neurotic, socially awkward personality and your tendency to get into awkward situations. 
-    You're often frustrated by social norms and petty annoyances. You're direct, blunt, 
-    and have a unique perspective on everyday life.
-    
-    Generate a short, funny quote as if you're Larry David. Make it sound 
-    exactly like something Larry David would say. It should be observational, slightly 
-    complaining, and highlight the absurdity of modern life.
-    
-    - Be under 281 characters (Twitter/X-friendly)
-    - Reflect Larry's neurotic, petty, or brutally honest personality
-    - Be observational, cranky, or socially awkward—like a mini-rant or ethical debate
-    - Feel like something he'd say mid-confrontation or in a passive-aggressive monologue
-    - Be self-contained and funny
-    - Do not include quotation marks before or after the quote
+            logger.error("Could not append to recent posts cache: %s", e)
 
-    Examples:
-    
-    - "I don't trust anyone who's nice to me but rude to the waiter. Because they're just 
-    waiting until they can be rude to me too."
-    
-    - "I don't like to make plans for the day because then the word 'premeditated' gets 
-    thrown around in the courtroom."
-        
-    - "I held the door for someone who was too far away. Now I'm standing here like a doorman. I didn't sign up for this."
-    
-    - "I don't understand why people take selfies with celebrities. What are you going to 
-    do with that? 'Here's me bothering a famous person'?"
+    def compact_posts_file(self):
+        """Rewrite the JSONL cache from the in-memory deque, atomically."""
+        try:
+            with self._cache_lock:
+                payload = ''.join(json.dumps(q) + '\n' for q in self.recent_posts)
+                count = len(self.recent_posts)
+            tmp_file = self.posts_cache_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                f.write(payload)
+            # Atomic rename so a crash mid-write can't corrupt the cache
+            os.replace(tmp_file, self.posts_cache_file)
+            self._cache_lines = count
+        except Exception as e:
+            logger.error("Could not compact recent posts cache: %s", e)
     
-    - "I said "bless you" once. You sneezed four more times. How many blessings do you need? It's not a sneeze-a-thon."
-
-    - "I asked if I could sample a grape. Suddenly I'm the shoplifter of the produce aisle."
-
-    - "I brought my own fork to the barbecue. Now I'm the weirdo? They had sporks, Jeff. Sporks!"
-
-    - "You can't call it "casual Friday" and then judge me for wearing Crocs. That's the deal. That's the contract."
-
-    - "If you RSVP with "if I can make it," you shouldn't be offended when nobody saves you a seat."
-
-    - "Why do people say "you'll love this show" like it's a threat? Now I have to love it or I'm the problem."
+    def _generate_with_retry(self, recent_quotes, temperature=None,
+                             attempts: int = 3, backoff: float = 1.5) -> List[str]:
+        """Call generate_quotes, retrying transient failures with exponential backoff."""
+        for attempt in range(attempts):
+            try:
+                return generate_quotes(self._model, recent_quotes, temperature=temperature)
+            except Exception as e:
+                if attempt == attempts - 1:
+                    raise
+                delay = backoff * (2 ** attempt)
+                logger.warning("Gemini call failed (%s); retrying in %.1fs", e, delay)
+                time.sleep(delay)
 
-    - "The minute you say "take your time," you've started a countdown. That's fake generosity.
+    def generate_larry_quote(self, temperature=None) -> str:
+        """Generate a new Larry David quote, batching candidates per Gemini call."""
+        if self._quote_buffer:
+            return self._quote_buffer.popleft()
 
-    Recent quotes (AVOID repeating these specific topics or exact phrasings):
-    {recent_quotes_text}
-    """
-        
         try:
             # Get last 10 recent posts to avoid repetition
-            recent_quotes = self.recent_posts[-10:] if self.recent_posts else []
-            recent_quotes_text = "\n    - ".join([f'"{q}"' for q in recent_quotes])
-            
+            recent_quotes = list(self.recent_posts)[-10:] if self.recent_posts else []
+
             if recent_quotes:
-                logger.info(f"Including {len(recent_quotes)} recent quotes in prompt to avoid repetition")
-            
-            formatted_prompt = prompt.format(recent_quotes_text=recent_quotes_text)
+                logger.info("Including %d recent quotes in prompt to avoid repetition", len(recent_quotes))
+
+            self._quote_buffer.extend(self._generate_with_retry(recent_quotes, temperature=temperature))
+            return self._quote_buffer.popleft()
 
-            model = genai.GenerativeModel('gemini-flash-latest')
-            response = model.generate_content(formatted_prompt)
-            
-            quote = response.text.strip()
-            
-            # Clean up the quote
-            if quote.startswith('"') and quote.endswith('"'):
-                quote = quote[1:-1]
-            
-            return quote
-            
         except Exception as e:
-            logger.error(f"Error generating quote: {e}")
+            logger.error("Error generating quote: %s", e)
             return self.get_fallback_quote()
     
     def get_fallback_quote(self) -> str:
         """Return a fallback Larry David quote if AI generation fails."""
-        fallback_quotes = [
-            "You know what I hate? When you're at a restaurant and the server says 'Enjoy your meal' and you say 'You too'.",
-            "I don't trust anyone who's nice to me but rude to the waiter. Because they're just waiting until they can be rude to me too.",
-            "I don't like to make plans for the day because then the word 'premeditated' gets thrown around in the courtroom.",
-            "You know what's interesting about politics? It's not interesting.",
-            "I'm not a fighter, but I am a big fan of the silent treatment."
-        ]
-        return random.choice(fallback_quotes)
+        # Prefer fallbacks we haven't posted recently; if all have been used,
+        # fall through to picking from the full tuple. A clock-based index is
+        # plenty random for picking a canned joke and avoids importing random.
+        pool = [q for q in _FALLBACK_QUOTES if not self.is_duplicate(q)] or _FALLBACK_QUOTES
+        return pool[time.time_ns() % len(pool)]
     
     def is_duplicate(self, quote: str) -> bool:
-        """Check if a quote is a duplicate of recent posts."""
-        return quote in self.recent_posts
+        """Check if a quote is a (near-)duplicate of recent posts."""
+        return _norm_quote(quote) in self._norm_set
     
     def post_to_twitter(self, quote: str) -> bool:
         """Post the quote to Twitter (X) using API v2. Returns True on success."""
@@ -193,87 +344,85 @@ class LarryDavidBot:
             logger.info("Twitter client not configured; skipping tweet.")
             return False
             
-        # Twitter has 280-character limit
-        tweet_text = quote[:280]
-        
+        # Twitter has 280-character limit; only copy when we have to truncate
+        tweet_text = quote if len(quote) <= 280 else quote[:280]
+
         try:
-            response = self.twitter_client.create_tweet(text=tweet_text)
+            response = self.twitter_client.create_tweet(text=tweet_text, user_auth=True)
             if response and response.data and response.data.get('id'):
-                logger.info(f"Successfully tweeted quote (ID: {response.data['id']})")
+                logger.info("Successfully tweeted quote (ID: %s)", response.data['id'])
                 return True
             else:
                 logger.error("Failed to get tweet ID from Twitter API response")
                 return False
-                
-        except tweepy.TweepyException as e:
+
+        except self._tweepy.TweepyException as e:
             if hasattr(e, 'response') and e.response is not None:
                 status_code = e.response.status_code
-                error_msg = str(e)
-                
-                if status_code == 403:
-                    logger.error("Twitter API Error: Authentication or permission error. "
-                               "Please check your API keys and app permissions.")
-                elif status_code == 401:
-                    logger.error("Twitter API Error: Invalid or expired credentials. "
-                               "Please check your Twitter API keys and access tokens.")
-                elif status_code == 429:
-                    logger.error("Twitter API Error: Rate limit exceeded. The bot will try again later.")
-                else:
-                    logger.error(f"Twitter API Error ({status_code}): {error_msg}")
+                logger.error(_TWITTER_ERROR_MESSAGES.get(
+                    status_code, f"Twitter API Error ({status_code}): {e}"))
             else:
-                logger.error(f"Twitter API Error: {str(e)}")
-                
+                logger.error("Twitter API Error: %s", e)
+
             return False
     
     def post_to_bluesky(self, text: str) -> bool:
         """Post the given text to Bluesky."""
         try:
-            # Use RichText if available for better formatting
-            if RichText is not None:
-                rt = RichText(text)
+            # Larry quotes virtually never contain URLs; only pay for the
+            # RichText link-detection regex when a link-like substring shows up
+            if self._RichText is None or not _has_url(text):
+                post = self.client.send_post(text=text)
+            else:
+                rt = self._RichText(text)
                 rt.detect_links()
                 post = self.client.send_post(text=rt.text, facets=rt.facets)
-            else:
-                post = self.client.send_post(text=text)
             
             post_uri = post.uri
-            self.recent_posts.append(text)
-            # Keep only the most recent posts in cache
-            if len(self.recent_posts) > self.max_cache_size:
-                self.recent_posts = self.recent_posts[-self.max_cache_size:]
-            self.save_recent_posts()
-            logger.info(f"Posted to Bluesky: {text}")
+            with self._cache_lock:
+                # deque(maxlen=...) evicts the oldest entry on append; mirror that in the set
+                if len(self.recent_posts) == self.max_cache_size:
+                    self._norm_set.discard(_norm_quote(self.recent_posts[0]))
+                self.recent_posts.append(text)
+                self._norm_set.add(_norm_quote(text))
+                self.append_post(text)
+            logger.info("Posted to Bluesky: %s", text)
             return True
         except Exception as e:
-            logger.error(f"Error posting to Bluesky: {e}")
+            logger.error("Error posting to Bluesky: %s", e)
             return False
     
     def post_quote(self):
         """Generate and post a new Larry David quote to Bluesky."""
         try:
-            # Generate a unique quote
-            max_attempts = 10
+            # Generate a unique quote. Three attempts with a rising temperature
+            # hint is enough: if those all collide the model has locked into a
+            # mode and further calls are wasted round trips
+            max_attempts = 3
             for attempt in range(max_attempts):
-                quote = self.generate_larry_quote()
-                
+                quote = self.generate_larry_quote(temperature=0.7 + 0.1 * attempt)
+
                 if not self.is_duplicate(quote):
                     break
-                logger.info(f"Generated duplicate quote, trying again (attempt {attempt + 1})")
+                logger.info("Generated duplicate quote, trying again (attempt %d)", attempt + 1)
             else:
                 logger.warning("Could not generate unique quote after max attempts, using fallback")
                 quote = self.get_fallback_quote()
             
-            # Post to Bluesky
-            self.post_to_bluesky(quote)
-            
-            # Also post to Twitter
-            self.post_to_twitter(quote)
-            
-            logger.info(f"Posted quote: {quote}")
+            # Post to Bluesky and Twitter concurrently; both are independent
+            # network calls so total latency is the slower of the two
+            futures = [
+                self._exec.submit(self.post_to_bluesky, quote),
+                self._exec.submit(self.post_to_twitter, quote),
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+            logger.info("Posted quote: %s", quote)
             return True
             
         except Exception as e:
-            logger.error(f"Error posting quote: {e}")
+            logger.error("Error posting quote: %s", e)
             return False
     
     def run_scheduler(self):
@@ -287,10 +436,20 @@ class LarryDavidBot:
         logger.info("Posting initial quote...")
         self.post_quote()
         
-        # Run the scheduler
-        while True:
+        # Run the scheduler, sleeping until the next job is actually due
+        # instead of waking every minute; Event.wait() returns immediately
+        # when the bot is stopped
+        while not self._stop.is_set():
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            sleep_s = schedule.idle_seconds()
+            if sleep_s is None:
+                sleep_s = 60  # No jobs scheduled; re-check in a minute
+            # Clamp: at least 1s (overdue jobs), at most an hour (clock drift)
+            self._stop.wait(max(1, min(sleep_s, 3600)))
+
+    def stop(self):
+        """Signal the scheduler loop to exit."""
+        self._stop.set()
 
 def main():
     """Main function to run the bot."""
@@ -300,7 +459,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
-        logger.error(f"Bot error: {e}")
+        logger.error("Bot error: %s", e)
         raise
 
 if __name__ == "__main__":
@@ -6,7 +6,8 @@ Test script for Larry David Bot - generates quotes without posting to Bluesky
 import os
 import sys
 from dotenv import load_dotenv
-import google.generativeai as genai
+
+from larry_david_bot import generate_quotes
 
 # Load environment variables
 load_dotenv()
@@ -14,74 +15,21 @@ load_dotenv()
 def test_quote_generation():
     """Test the quote generation functionality."""
     gemini_api_key = os.getenv('GEMINI_API_KEY')
-    
+
     if not gemini_api_key:
         print("❌ GEMINI_API_KEY not found in environment variables")
         return False
-    
-    genai.configure(api_key=gemini_api_key)
-    
-    prompt = """You are Larry David from Curb Your Enthusiasm. You're known for your 
-    neurotic, socially awkward personality and your tendency to get into awkward situations. 
-    You're often frustrated by social norms and petty annoyances. You're direct, blunt, 
-    and have a unique perspective on everyday life.
-    
-    Generate a short, funny quote as if you're Larry David. Make it sound 
-    exactly like something Larry David would say. It should be observational, slightly 
-    complaining, and highlight the absurdity of modern life.
-    
-    - Be under 281 characters (Twitter/X-friendly)
-    - Reflect Larry's neurotic, petty, or brutally honest personality
-    - Be observational, cranky, or socially awkward—like a mini-rant or ethical debate
-    - Feel like something he'd say mid-confrontation or in a passive-aggressive monologue
-    - Do NOT start a quote with "You know" or "You ever"
-    - Do NOT end the quote with "you know.." or similar repetitive phrases
-    - Be self-contained and funny
-    - Do not include quotation marks before or after the quote
-
-    Examples:
-    
-    - "I don't trust anyone who's nice to me but rude to the waiter. Because they're just 
-    waiting until they can be rude to me too."
-    
-    - "I don't like to make plans for the day because then the word 'premeditated' gets 
-    thrown around in the courtroom."
-        
-    - "I held the door for someone who was too far away. Now I'm standing here like a doorman. I didn't sign up for this."
-    
-    - "I don't understand why people take selfies with celebrities. What are you going to 
-    do with that? 'Here's me bothering a famous person'?"
-    
-    - "I said "bless you" once. You sneezed four more times. How many blessings do you need? It's not a sneeze-a-thon."
-
-    - "I asked if I could sample a grape. Suddenly I'm the shoplifter of the produce aisle."
-
-    - "I brought my own fork to the barbecue. Now I'm the weirdo? They had sporks, Jeff. Sporks!"
 
-    - "You can't call it "casual Friday" and then judge me for wearing Crocs. That's the deal. That's the contract."
+    # Imported here so the other tests don't pay for the genai dependency tree
+    import google.generativeai as genai
 
-    - "If you RSVP with "if I can make it," you shouldn't be offended when nobody saves you a seat."
-
-    - "Why do people say "you'll love this show" like it's a threat? Now I have to love it or I'm the problem."
-
-    - "The minute you say "take your time," you've started a countdown. That's fake generosity.
-
-    Recent quotes (AVOID repeating these specific topics or exact phrasings):
-    {recent_quotes_text}
-    """
+    genai.configure(api_key=gemini_api_key)
 
     try:
         print("🤖 Testing Gemini API connection...")
         model = genai.GenerativeModel('gemini-flash-latest')
-        formatted_prompt = prompt.format(recent_quotes_text="")
-        response = model.generate_content(formatted_prompt)
-        
-        quote = response.text.strip()
-        
-        # Clean up the quote
-        if quote.startswith('"') and quote.endswith('"'):
-            quote = quote[1:-1]
-        
+        quote = generate_quotes(model)[0]
+
         print("✅ Gemini API connection successful!")
         print(f"📝 Generated quote: {quote}")
         print(f"📏 Character count: {len(quote)}")
@@ -137,39 +85,36 @@ def test_environment_variables():
         'TWITTER_ACCESS_SECRET'
     ]
     
-    # Check if any Twitter credentials are set
-    twitter_configured = any(os.getenv(var) for var in twitter_vars)
-    
-    all_set = True
+    # Snapshot the environment once and compute what's missing in one pass
+    env = os.environ
+    missing_required = [var for var in required_vars if not env.get(var)]
+    missing_twitter = [var for var in twitter_vars if not env.get(var)]
+    twitter_configured = len(missing_twitter) < len(twitter_vars)
+
     # Test required variables
     for var in required_vars:
-        value = os.getenv(var)
-        if value:
-            print(f"✅ {var}: Set")
-        else:
+        if var in missing_required:
             print(f"❌ {var}: Not set")
-            all_set = False
-    
+        else:
+            print(f"✅ {var}: Set")
+
     # Test Twitter variables
     print("\n🔍 Twitter API Configuration:")
-    twitter_status = ""
-    if twitter_configured:
-        missing = [var for var in twitter_vars if not os.getenv(var)]
-        if missing:
-            print(f"⚠️  Twitter API partially configured. Missing: {', '.join(missing)}")
-            twitter_status = "Partially Configured"
-            
-            # Check if at least Bearer Token is set (required for v2)
-            if not os.getenv('TWITTER_BEARER_TOKEN'):
-                print("❌ TWITTER_BEARER_TOKEN is required for Twitter API v2")
-        else:
-            print("✅ Twitter API v2 fully configured")
-            twitter_status = "Fully Configured"
-    else:
+    if not twitter_configured:
         print("ℹ️  Twitter API not configured (optional)")
         twitter_status = "Not Configured"
-    
-    return all_set, twitter_status
+    elif missing_twitter:
+        print(f"⚠️  Twitter API partially configured. Missing: {', '.join(missing_twitter)}")
+        twitter_status = "Partially Configured"
+
+        # Check if at least Bearer Token is set (required for v2)
+        if 'TWITTER_BEARER_TOKEN' in missing_twitter:
+            print("❌ TWITTER_BEARER_TOKEN is required for Twitter API v2")
+    else:
+        print("✅ Twitter API v2 fully configured")
+        twitter_status = "Fully Configured"
+
+    return not missing_required, twitter_status
 
 def main():
     """Run all tests."""